@@ -1,27 +1,181 @@
 import threading
+import time
+from dataclasses import dataclass, replace
+
+from kivy.clock import Clock
+from kivy.event import EventDispatcher
+from kivy.properties import BooleanProperty, ColorProperty, NumericProperty, StringProperty
 
 n_pads = 6
 
+@dataclass(frozen=True, slots=True)
 class Pad:
-    def __init__(self):
-        self.team_id = 0
-        self.ip_address = ""
-        self.rssi = -100
-        self.rssi_color = "red"
-        self.continuity = False
-        self.continuity_color = "red"
-        self.voltage = 0.0
-        self.voltage_color = "red"
-        self.arm_status = False
-        self.arm_color = "green"
-        self.last_seen = 0
-        self.last_seen_color = "black"
-        self.buzzer_on = False
-        self.led_on = False
-        self.rdy_on = False
-
-pad_data = {i: Pad() for i in range(n_pads)}
-
-pad_data_lock = threading.Lock()
-
-flag_status = ["green"]
\ No newline at end of file
+    """Immutable snapshot of a pad; writers publish a new one with `replace`."""
+
+    team_id: int = 0
+    ip_address: str = ""
+    rssi: float = -100
+    rssi_color: str = "red"
+    continuity: bool = False
+    continuity_color: str = "red"
+    voltage: float = 0.0
+    voltage_color: str = "red"
+    arm_status: bool = False
+    arm_color: str = "green"
+    buzzer_on: bool = False
+    led_on: bool = False
+    rdy_on: bool = False
+
+# Readers take `pad_data[i]` without locking: snapshots are swapped in whole.
+pad_data = [Pad() for _ in range(n_pads)]
+
+# Serialize the read-modify-write swaps of concurrent writers, one lock per pad.
+pad_data_locks = [threading.Lock() for _ in range(n_pads)]
+
+# Monotonic time each pad was last heard from; single float stores, read without a lock.
+pad_seen_at = [time.monotonic()] * n_pads
+
+
+def mark_pad_seen(pad_num):
+    """Record that *pad_num* was just heard from."""
+    pad_seen_at[pad_num] = time.monotonic()
+
+
+class PadState(EventDispatcher):
+    """Observable mirror of a `Pad`, updated on the Kivy thread by the coalesced flush."""
+
+    team_id = NumericProperty(0)
+    ip_address = StringProperty("")
+    rssi = NumericProperty(-100)
+    rssi_color = ColorProperty("red")
+    continuity = BooleanProperty(False)
+    continuity_color = ColorProperty("red")
+    voltage = NumericProperty(0.0)
+    voltage_color = ColorProperty("red")
+    arm_status = BooleanProperty(False)
+    arm_color = ColorProperty("green")
+    last_seen = NumericProperty(0)
+    last_seen_color = ColorProperty("black")
+    buzzer_on = BooleanProperty(False)
+    led_on = BooleanProperty(False)
+    rdy_on = BooleanProperty(False)
+
+
+# Widgets bind to these; Kivy only dispatches properties whose value changed.
+pad_states = [PadState() for _ in range(n_pads)]
+
+
+def _refresh_last_seen(dt):
+    """Derive each pad's seconds-since-contact from its timestamp, once per UI second."""
+    now = time.monotonic()
+    for state, seen_at in zip(pad_states, pad_seen_at):
+        last_seen = int(now - seen_at)
+        state.last_seen = last_seen
+        state.last_seen_color = "red" if last_seen > 30 else "black"
+
+
+Clock.schedule_interval(_refresh_last_seen, 1)
+
+
+class PadStateMirror:
+    """Mixin keeping a widget's `PAD_FIELDS` properties bound to one `PadState`."""
+
+    PAD_FIELDS = ()
+    _mirrored_state = None
+
+    def mirror_pad(self, pad_num):
+        """Bind to the state of *pad_num*, dropping any previous pad, and copy its values."""
+        self.release_pad()
+        state = pad_states[int(pad_num)]
+        for field in self.PAD_FIELDS:
+            state.fbind(field, self._on_pad_field, field)
+            self._on_pad_field(field, state, getattr(state, field))
+        self._mirrored_state = state
+
+    def release_pad(self):
+        """Stop following the bound pad state, e.g. while the widget is hidden."""
+        state = self._mirrored_state
+        if state is None:
+            return
+        for field in self.PAD_FIELDS:
+            state.funbind(field, self._on_pad_field, field)
+        self._mirrored_state = None
+
+    def _on_pad_field(self, field, state, value):
+        setattr(self, field, value)
+
+
+FLAG_IMAGES = {
+    "green": "assets/greenflag.png",
+    "yellow": "assets/yellowflag.png",
+    "red": "assets/redflag.png",
+}
+PAD_LETTERS = [chr(ord('A') + i) for i in range(n_pads)]
+
+
+class TimeClock(EventDispatcher):
+    """Wall-clock string shared by every screen header."""
+
+    now_str = StringProperty("")
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._last_second = None
+        self._tick(0)
+        Clock.schedule_interval(self._tick, 1)
+
+    def _tick(self, dt):
+        # Catch-up ticks landing in the same second would format the same string.
+        second = int(time.time())
+        if second == self._last_second:
+            return
+        self._last_second = second
+        self.now_str = time.strftime("%d-%m-%Y %H:%M:%S", time.localtime(second))
+
+
+time_clock = TimeClock()
+
+
+class GlobalState(EventDispatcher):
+    """Observable range-wide state shared by every screen."""
+
+    flag = StringProperty("green")
+
+
+global_state = GlobalState()
+
+PAD_FLUSH_INTERVAL = 0.05   # seconds pad changes are coalesced before reaching the UI
+
+_pending_updates = {}       # pad_num -> {field: value}
+_pending_lock = threading.Lock()
+_flush_scheduled = False
+
+
+def queue_pad_update(pad_num, **fields):
+    """Write *fields* into the pad and queue the ones that changed for the UI."""
+    global _flush_scheduled
+    with pad_data_locks[pad_num]:
+        pad = pad_data[pad_num]
+        changes = {field: value for field, value in fields.items() if getattr(pad, field) != value}
+        if changes:
+            pad_data[pad_num] = replace(pad, **changes)
+    if not changes:
+        return
+    with _pending_lock:
+        _pending_updates.setdefault(pad_num, {}).update(changes)
+        if _flush_scheduled:
+            return
+        _flush_scheduled = True
+    Clock.schedule_once(_flush_pad_updates, PAD_FLUSH_INTERVAL)
+
+
+def _flush_pad_updates(dt):
+    """Publish the coalesced pad changes onto the observable pad states in one pass."""
+    global _pending_updates, _flush_scheduled
+    with _pending_lock:
+        pending, _pending_updates = _pending_updates, {}
+        _flush_scheduled = False
+    for pad_num, changes in pending.items():
+        state = pad_states[pad_num]
+        for field, value in changes.items():
+            setattr(state, field, value)
@@ -3,7 +3,17 @@ RLCU (Remote Launch Control Unit) HMI Application
 
 """
 
+import logging
+
 # Kivy imports
+from kivy.config import Config
+
+# Input settings only apply if set before the window is created.
+Config.set("input", "mouse", "mouse,disable_multitouch")
+
+# Socket activity goes through the "rlcu" logger; DEBUG adds per-command and discovery traces.
+logging.getLogger("rlcu").setLevel(logging.INFO)
+
 from kivy.lang import Builder
 from kivy.core.window import Window
 from kivy.factory import Factory
@@ -18,10 +28,33 @@ from pad_card import PadCard
 from serial_dialog import SerialDialog
 from socket_dialog import SocketDialog
 from rlcu_socket import rlcu_socket
+from globals import time_clock
+
+# Rules are installed together; the overview file carries the root rule.
+KV_FILES = (
+    "pad_detail_screen.kv",
+    "pad_card.kv",
+    "serial_dialog.kv",
+    "socket_dialog.kv",
+    "overview_screen.kv",
+)
+
+
+def load_kv():
+    """Parse every KV file in a single Builder pass and return the root widget."""
+    sources = []
+    for path in KV_FILES:
+        with open(path, encoding="utf-8") as kv_file:
+            sources.append(kv_file.read())
+    return Builder.load_string("\n".join(sources))
+
 
 class RLCUApp(MDApp):
     """Main application class for the RLCU HMI."""
 
+    # Shared clock the screen headers bind to in KV
+    time_clock = time_clock
+
     def build(self):
         """Build and return the root widget."""
         self.theme_cls.theme_style = "Light"
@@ -29,20 +62,12 @@ class RLCUApp(MDApp):
         Window.fullscreen = "auto"
 
         # Load KV files
-        Builder.load_file("pad_detail_screen.kv")
-        Builder.load_file("pad_card.kv")
-        Builder.load_file("serial_dialog.kv")
-        Builder.load_file("socket_dialog.kv")
-        root = Builder.load_file("overview_screen.kv")
+        root = load_kv()
 
         # Add pad detail screen
         pad_detail_screen = Factory.PadDetailScreen(name="pad_detail")
         root.add_widget(pad_detail_screen)
 
-        from kivy.config import Config
-
-        Config.set("input", "mouse", "mouse,disable_multitouch")
-
         # Bind window close event
         Window.bind(on_request_close=self.on_request_close)
 
@@ -1,9 +1,7 @@
 import sys
-from datetime import datetime
 
 # Kivy imports
 from kivy.factory import Factory
-from kivy.clock import Clock
 from kivy.uix.screenmanager import Screen
 
 # KivyMD imports
@@ -19,35 +17,71 @@ from kivymd.uix.dialog import (
 )
 
 # Local imports
-from globals import n_pads, flag_status
+from globals import n_pads, global_state, FLAG_IMAGES, PAD_LETTERS
 from rlcu_serial import rlcu_serial
 from rlcu_socket import rlcu_socket
 from serial_dialog import SerialDialog
 from socket_dialog import SocketDialog
 
+_GREEN = (0, 1, 0, 1)
+_RED = (1, 0, 0, 1)
+
 class OverviewScreen(Screen):
     """
     Main overview screen displaying the launch pads, connection status, and settings access.
     """
 
     _cards_added = False
+    _exit_dialog_open = False
+    flag_dialog = None
     exit_dialog = None
+    pad_cards = None
+    # Cached in on_kv_post; the first on_enter fires before the class rules are applied.
+    _serial_label = None
+    _socket_label = None
 
     def set_flag(self, flag, *args):
-        if flag == "green":
-            self.ids.flag_image.source = "assets/greenflag.png"
-            flag_status[0] = "green"
-        elif flag == "yellow":
-            self.ids.flag_image.source = "assets/yellowflag.png"
-            flag_status[0] = "yellow"
-        else:
-            self.ids.flag_image.source = "assets/redflag.png"
-            flag_status[0] = "red"
+        if flag not in FLAG_IMAGES:
+            flag = "red"
+        self._flag_image.source = FLAG_IMAGES[flag]
+        global_state.flag = flag
         self.flag_dialog.dismiss()
 
     def show_flag_dialog(self, *args):
         """Present a quick flag selector for the current launch range status."""
+        self.flag_dialog.open()
+
+    def show_serial_dialog(self):
+        SerialDialog.show(self)
+
+    def show_socket_dialog(self):
+        SocketDialog.show(self)
+
+    def update_serial_label_color(self):
+        """Update the connection status label in the UI."""
+        if self._serial_label is None:
+            return
+        self._serial_label.text_color = _GREEN if rlcu_serial.connected else _RED
+
+    def update_socket_label_color(self):
+        """Update the socket status label in the UI."""
+        if self._socket_label is None:
+            return
+        self._socket_label.text_color = _GREEN if rlcu_socket.listening else _RED
+
+    def show_exit_dialog(self, *args):
+        if self._exit_dialog_open:
+            return
+        self._exit_dialog_open = True
+        self.exit_dialog.open()
 
+    def close_exit_dialog(self, *args):
+        if self._exit_dialog_open:
+            self.exit_dialog.dismiss()
+            self._exit_dialog_open = False
+
+    def _build_dialogs(self):
+        """Build the flag and exit dialogs once; they are reopened on demand."""
         self.flag_dialog = MDDialog(
             MDDialogHeadlineText(text="Select the flag color"),
             MDDialogButtonContainer(
@@ -69,52 +103,6 @@ class OverviewScreen(Screen):
             ),
             auto_dismiss=False,
         )
-        self.flag_dialog.open()
-
-    def show_serial_dialog(self):
-        SerialDialog.show(self)
-
-    def show_socket_dialog(self):
-        SocketDialog.show(self)
-
-    def update_serial_label_color(self):
-        """Update the connection status label in the UI."""
-
-        def do_update(dt):
-            label = self.ids.get("serial_label")
-            if label:
-                if rlcu_serial.connected:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (0, 1, 0, 1)  # Green
-                else:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (1, 0, 0, 1)  # Red
-
-        Clock.schedule_once(do_update, 0)
-
-    def update_socket_label_color(self):
-        """Update the socket status label in the UI."""
-
-        def do_update(dt):
-            label = self.ids.get("socket_label")
-            if label:
-                if rlcu_socket.listening:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (0, 1, 0, 1)  # Green
-                else:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (1, 0, 0, 1)  # Red
-
-        Clock.schedule_once(do_update, 0)
-
-    def update_time(self, dt):
-        """Update the datetime label every second."""
-        now = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        self.ids.datetime_label.text = now
-
-    def show_exit_dialog(self, *args):
-        if self.exit_dialog:
-            return
         self.exit_dialog = MDDialog(
             MDDialogHeadlineText(text="Exit Application"),
             MDDialogContentContainer(
@@ -134,12 +122,6 @@ class OverviewScreen(Screen):
             ),
             auto_dismiss=False,
         )
-        self.exit_dialog.open()
-
-    def close_exit_dialog(self, *args):
-        if self.exit_dialog:
-            self.exit_dialog.dismiss()
-            self.exit_dialog = None
 
     def exit_app(self, *args):
         self.close_exit_dialog()
@@ -149,21 +131,38 @@ class OverviewScreen(Screen):
     def on_enter(self, *args):
         self.update_socket_label_color()
         self.update_serial_label_color()
+        # The first on_enter runs before on_kv_post has built the cards.
+        if self.pad_cards:
+            for pad_num, card in self.pad_cards.items():
+                card.mirror_pad(pad_num)
         return super().on_enter(*args)
+
+    def on_leave(self, *args):
+        # Hidden cards stop following their pads; on_enter resyncs them.
+        if self.pad_cards:
+            for card in self.pad_cards.values():
+                card.release_pad()
+        return super().on_leave(*args)
     
     def on_kv_post(self, base_widget):
         """Initialize the pad grid after KV loading."""
-        if self._cards_added:
-            return
-        self.pad_cards = {}
-        pad_grid = self.ids.pad_grid
-        pad_grid.clear_widgets()
-
-        for i in range(n_pads):
-            card = Factory.PadCard()
-            card.pad_num = i
-            card.pad_letter = chr(ord('A') + i)
-            self.pad_cards[i] = card
-            pad_grid.add_widget(card)
-        self._cards_added = True
-        Clock.schedule_interval(self.update_time, 1)
\ No newline at end of file
+        self._serial_label = self.ids.serial_label
+        self._socket_label = self.ids.socket_label
+        self._flag_image = self.ids.flag_image
+        if not self._cards_added:
+            self.pad_cards = {}
+            pad_grid = self.ids.pad_grid
+            pad_grid.clear_widgets()
+
+            for i in range(n_pads):
+                card = Factory.PadCard()
+                card.pad_num = i
+                card.pad_letter = PAD_LETTERS[i]
+                card.mirror_pad(i)
+                self.pad_cards[i] = card
+                pad_grid.add_widget(card)
+            self._build_dialogs()
+            self._cards_added = True
+        # Covers the on_enter that ran before the labels existed.
+        self.update_socket_label_color()
+        self.update_serial_label_color()
@@ -1,19 +1,29 @@
 """Lightweight card widget mirroring per-pad state in the overview grid."""
 
 # Kivy imports
-from kivy.clock import Clock
 from kivy.properties import NumericProperty, BooleanProperty, ColorProperty, StringProperty
 
 # KivyMD imports
 from kivymd.uix.card import MDCard
 
 # Local imports
-from globals import pad_data, pad_data_lock
+from globals import PadStateMirror
 
 
-class PadCard(MDCard):
+class PadCard(PadStateMirror, MDCard):
     """Card widget representing a launch pad."""
 
+    # Pad fields mirrored by the card
+    PAD_FIELDS = (
+        "team_id",
+        "continuity",
+        "continuity_color",
+        "arm_status",
+        "arm_color",
+        "last_seen",
+        "last_seen_color",
+    )
+
     # Initial pad data properties
     pad_num = NumericProperty(0)
     pad_letter = StringProperty("")
@@ -24,19 +34,3 @@ class PadCard(MDCard):
     arm_color = ColorProperty("red")
     last_seen = NumericProperty(0)
     last_seen_color = ColorProperty("red")
-
-    def update_pad_data(self, dt):
-        """Update pad data fields every second."""
-
-        with pad_data_lock:
-            pad = pad_data[self.pad_num]
-        self.team_id = pad.team_id
-        self.continuity = pad.continuity
-        self.continuity_color = pad.continuity_color
-        self.arm_status = pad.arm_status
-        self.arm_color = pad.arm_color
-        self.last_seen = pad.last_seen
-        self.last_seen_color = pad.last_seen_color
-
-    def on_kv_post(self, base_widget):
-        Clock.schedule_interval(self.update_pad_data, 1)
@@ -1,7 +1,5 @@
 """Pad detail screen logic handling per-pad telemetry and launch controls."""
 
-from datetime import datetime
-
 # Kivy imports
 from kivy.clock import Clock
 from kivy.properties import NumericProperty, BooleanProperty, ColorProperty, StringProperty
@@ -12,13 +10,33 @@ from kivy.metrics import dp
 from kivymd.uix.snackbar import MDSnackbar, MDSnackbarSupportingText, MDSnackbarButtonContainer, MDSnackbarActionButton, MDSnackbarActionButtonText, MDSnackbarCloseButton
 
 # Local imports
-from globals import pad_data, pad_data_lock, flag_status
+from globals import pad_data, global_state, queue_pad_update, PadStateMirror, FLAG_IMAGES, PAD_LETTERS
 from rlcu_serial import rlcu_serial
 from rlcu_socket import rlcu_socket
 
+_GREEN = (0, 1, 0, 1)
+_RED = (1, 0, 0, 1)
+
 
-class PadDetailScreen(Screen):
+class PadDetailScreen(PadStateMirror, Screen):
     """Screen for detailed view of a specific launch pad."""
+
+    # Pad fields mirrored by the screen
+    PAD_FIELDS = (
+        "team_id",
+        "rssi",
+        "rssi_color",
+        "continuity",
+        "continuity_color",
+        "arm_status",
+        "arm_color",
+        "voltage",
+        "voltage_color",
+        "ip_address",
+        "last_seen",
+        "last_seen_color",
+    )
+
     pad_num = NumericProperty(0)
     pad_letter = StringProperty("")
     team_id = NumericProperty(0)
@@ -46,99 +64,62 @@ class PadDetailScreen(Screen):
         self.pad_letter = ""
         self._suppress_arm_checkbox = False
         self._revert_event = None
+        self._checklist_state = None
+
+    def on_pad_num(self, instance, pad_num):
+        """Follow the observable state of the newly selected pad while the screen is shown."""
+        if self._mirrored_state is not None:
+            self.mirror_pad(pad_num)
 
     def update_serial_label_color(self):
         """Update the connection status label in the UI."""
-
-        def do_update(dt):
-            label = self.ids.get("serial_label")
-            if label:
-                if rlcu_serial.connected:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (0, 1, 0, 1)  # Green
-                else:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (1, 0, 0, 1)  # Red
-        Clock.schedule_once(do_update, 0)
+        self._serial_label.text_color = _GREEN if rlcu_serial.connected else _RED
 
     def update_socket_label_color(self):
         """Update the socket status label in the UI."""
+        self._socket_label.text_color = _GREEN if rlcu_socket.listening else _RED
 
-        def do_update(dt):
-            label = self.ids.get("socket_label")
-            if label:
-                if rlcu_socket.listening:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (0, 1, 0, 1)  # Green
-                else:
-                    label.md_theme_color = "Custom"
-                    label.text_color = (1, 0, 0, 1)  # Red
-
-        Clock.schedule_once(do_update, 0)
-
-    def update_time(self, dt):
-        now = datetime.now().strftime("%d-%m-%Y %H:%M:%S")
-        self.ids.datetime_label.text = now
-
-    def update_data(self, dt):
-        """Update pad data fields."""
-        with pad_data_lock:
-            pad = pad_data[self.pad_num]
-        self.team_id = pad.team_id
-        self.rssi = pad.rssi
-        self.rssi_color = pad.rssi_color
-        self.continuity = pad.continuity
-        self.continuity_color = pad.continuity_color
-        self.arm_status = pad.arm_status
-        self.arm_color = pad.arm_color
-        self.voltage = pad.voltage
-        self.voltage_color = pad.voltage_color
-        self.ip_address = pad.ip_address
-        self.last_seen = pad.last_seen
-        self.last_seen_color = pad.last_seen_color
+    def _on_pad_field(self, field, state, value):
+        super()._on_pad_field(field, state, value)
+        if field in ("last_seen", "arm_status"):
+            self._update_checklist_status()
 
+    def _on_flag_changed(self, instance, flag):
         self._update_checklist_status()
         self._update_flag_image()
 
     def set_team_id(self):
         """Update the team ID on the corresponding pad card."""
         team_id = self.ids.team_id_field.text.strip()
-        with pad_data_lock:
-            pad_data[self.pad_num].team_id = int(team_id) if team_id.isdigit() else 0
-            self.team_id = pad_data[self.pad_num].team_id
+        self.team_id = int(team_id) if team_id.isdigit() else 0
+        queue_pad_update(self.pad_num, team_id=self.team_id)
 
     def _update_checklist_status(self):
-        # Update Checklist Statuses
-        self.last_seen_checklist_color = (
-            "green" if self.last_seen <= 30 else "red"
-        )
-        self.ids.last_seen_icon.icon = (
-            "check-circle" if self.last_seen <= 30 else "alert-circle"
-        )
-        
-        if flag_status[0] == "red":
+        # Update Checklist Statuses, only touching the widgets when an input changed
+        online = self.last_seen <= 30
+        area_clear = global_state.flag == "red"
+        state = (online, area_clear, self.arm_status)
+        if state == self._checklist_state:
+            return
+        self._checklist_state = state
+
+        self.last_seen_checklist_color = "green" if online else "red"
+        self._last_seen_icon.icon = "check-circle" if online else "alert-circle"
+
+        if area_clear:
             self.flag_checklist_color = "green"
-            self.ids.flag_icon.icon = "check-circle"
+            self._flag_icon.icon = "check-circle"
             self.flag_checklist_status = "Launch Area is CLEAR"
         else:
             self.flag_checklist_color = "red"
-            self.ids.flag_icon.icon = "alert-circle"
+            self._flag_icon.icon = "alert-circle"
             self.flag_checklist_status = "Launch Area is NOT CLEAR"
-            
-        self.arm_checklist_color = (
-            "green" if self.arm_status else "red"
-        )
-        self.ids.arm_icon.icon = (
-            "check-circle" if self.arm_status else "alert-circle"
-        )
+
+        self.arm_checklist_color = "green" if self.arm_status else "red"
+        self._arm_icon.icon = "check-circle" if self.arm_status else "alert-circle"
 
     def _update_flag_image(self):
-        if flag_status[0] == "green":
-            self.ids.flag_image.source = "assets/greenflag.png"
-        elif flag_status[0] == "yellow":
-            self.ids.flag_image.source = "assets/yellowflag.png"
-        else:
-            self.ids.flag_image.source = "assets/redflag.png"
+        self._flag_image.source = FLAG_IMAGES[global_state.flag]
 
     def on_checkbox_active(self, checkbox, value):
         if self._suppress_arm_checkbox:
@@ -152,8 +133,7 @@ class PadDetailScreen(Screen):
         else:
             self.arm_hmi = False
             self.ids.launch_button.md_bg_color = (1, 0.7, 0.7)
-        with pad_data_lock:
-            pad_data[self.pad_num].rdy_on = self.arm_hmi
+        queue_pad_update(self.pad_num, rdy_on=self.arm_hmi)
         if rlcu_socket.has_active_connection(self.pad_num):
             rlcu_socket.send_command(
                 pad_num=self.pad_num,
@@ -164,49 +144,9 @@ class PadDetailScreen(Screen):
     def initiate_launch_sequence(self):
         """Initiate the launch sequence if all conditions are met."""
         if not self.arm_hmi:
-            snackbar =MDSnackbar(
-                MDSnackbarSupportingText(
-                    text="Please confirm launch by checking the box.",
-                    font_style="Headline",
-                    role="large",
-                    halign="center",
-                ),
-                MDSnackbarButtonContainer(
-                    MDSnackbarCloseButton(
-                        icon="close",
-                        on_release=lambda x: snackbar.dismiss(),
-                    ),
-                    pos_hint={"center_y": 0.5}
-                ),
-                y=dp(24),
-                orientation="horizontal",
-                pos_hint={"center_x": 0.5, "center_y": 0.5},
-                size_hint_x=0.5,
-                size_hint_y=0.06,
-            )
-            snackbar.open()
+            self._show_snackbar(self._confirm_snackbar)
         else:
-            snackbar =MDSnackbar(
-                MDSnackbarSupportingText(
-                    text="Launch sequence initiated!",
-                    font_style="Headline",
-                    role="large",
-                    halign="center",
-                ),
-                MDSnackbarButtonContainer(
-                    MDSnackbarCloseButton(
-                        icon="close",
-                        on_release=lambda x: snackbar.dismiss(),
-                    ),
-                    pos_hint={"center_y": 0.5}
-                ),
-                y=dp(24),
-                orientation="horizontal",
-                pos_hint={"center_x": 0.5, "center_y": 0.5},
-                size_hint_x=0.5,
-                size_hint_y=0.06,
-            )
-            snackbar.open()
+            self._show_snackbar(self._launch_snackbar)
             if rlcu_socket.has_active_connection(self.pad_num):
                 rlcu_socket.send_command(
                     pad_num=self.pad_num,
@@ -228,8 +168,7 @@ class PadDetailScreen(Screen):
             return
         self.arm_hmi = False
         self.ids.arm_hmi_checkbox.active = False
-        with pad_data_lock:
-            pad_data[self.pad_num].rdy_on = False
+        queue_pad_update(self.pad_num, rdy_on=False)
         if rlcu_socket.has_active_connection(self.pad_num):
             rlcu_socket.send_command(
                 pad_num=self.pad_num,
@@ -239,62 +178,60 @@ class PadDetailScreen(Screen):
 
     def update_button_texts(self):
         """Update the button texts based on current states."""
-        with pad_data_lock:
-            if pad_data[self.pad_num].buzzer_on:
-                self.ids.buzzer_button_text.text = "Buzzer OFF"
-            else:
-                self.ids.buzzer_button_text.text = "Buzzer ON"
-
-            if pad_data[self.pad_num].led_on:
-                self.ids.led_button_text.text = "LED OFF"
-            else:
-                self.ids.led_button_text.text = "LED ON"
+        pad = pad_data[self.pad_num]
+        if pad.buzzer_on:
+            self.ids.buzzer_button_text.text = "Buzzer OFF"
+        else:
+            self.ids.buzzer_button_text.text = "Buzzer ON"
+
+        if pad.led_on:
+            self.ids.led_button_text.text = "LED OFF"
+        else:
+            self.ids.led_button_text.text = "LED ON"
     
     def toggle_buzzer(self):
         """Toggle the buzzer state."""
-        with pad_data_lock:
-            current_state = pad_data[self.pad_num].buzzer_on
-        next_state = not current_state
+        next_state = not pad_data[self.pad_num].buzzer_on
         if rlcu_socket.send_command(
             pad_num=self.pad_num,
             command=rlcu_socket.CMD_BUZZER,
             enable=next_state,
         ):
-            with pad_data_lock:
-                pad_data[self.pad_num].buzzer_on = next_state
+            queue_pad_update(self.pad_num, buzzer_on=next_state)
         self.update_button_texts()
 
     def toggle_led(self):
         """Toggle the LED state."""
-        with pad_data_lock:
-            current_state = pad_data[self.pad_num].led_on
-        next_state = not current_state
+        next_state = not pad_data[self.pad_num].led_on
         if rlcu_socket.send_command(
             pad_num=self.pad_num,
             command=rlcu_socket.CMD_LED,
             enable=next_state,
         ):
-            with pad_data_lock:
-                pad_data[self.pad_num].led_on = next_state
+            queue_pad_update(self.pad_num, led_on=next_state)
         self.update_button_texts()
 
 
     def on_enter(self, *args):
         """Called when entering the pad detail screen."""
-        self.update_data(0)
+        self.mirror_pad(self.pad_num)
+        global_state.bind(flag=self._on_flag_changed)
+        self._on_flag_changed(global_state, global_state.flag)
         self.update_socket_label_color()
         self.update_serial_label_color()
         self.update_button_texts()
-        self.pad_letter = chr(ord('A') + self.pad_num)
+        self.pad_letter = PAD_LETTERS[self.pad_num]
 
     def on_leave(self):
+        # Nothing on this screen is visible until on_enter binds it again.
+        self.release_pad()
+        global_state.unbind(flag=self._on_flag_changed)
         if self._revert_event:
             Clock.unschedule(self._revert_event)
             self._revert_event = None
         self.arm_hmi = False
         self.ids.arm_hmi_checkbox.active = False
-        with pad_data_lock:
-            pad_data[self.pad_num].rdy_on = False
+        queue_pad_update(self.pad_num, rdy_on=False)
         if rlcu_socket.has_active_connection(self.pad_num):
             rlcu_socket.send_command(
                 pad_num=self.pad_num,
@@ -303,8 +240,43 @@ class PadDetailScreen(Screen):
             )
 
     def on_kv_post(self, base_widget):
-        self.update_event = Clock.schedule_interval(self.update_data, 1)
-        Clock.schedule_interval(self.update_time, 1)
+        self._serial_label = self.ids.serial_label
+        self._socket_label = self.ids.socket_label
+        self._last_seen_icon = self.ids.last_seen_icon
+        self._flag_icon = self.ids.flag_icon
+        self._arm_icon = self.ids.arm_icon
+        self._flag_image = self.ids.flag_image
+        self._confirm_snackbar = self._build_snackbar("Please confirm launch by checking the box.")
+        self._launch_snackbar = self._build_snackbar("Launch sequence initiated!")
+
+    def _build_snackbar(self, text):
+        """Build a centered snackbar once so it can be reopened on every launch attempt."""
+        snackbar = MDSnackbar(
+            MDSnackbarSupportingText(
+                text=text,
+                font_style="Headline",
+                role="large",
+                halign="center",
+            ),
+            MDSnackbarButtonContainer(
+                MDSnackbarCloseButton(
+                    icon="close",
+                    on_release=lambda x: snackbar.dismiss(),
+                ),
+                pos_hint={"center_y": 0.5}
+            ),
+            y=dp(24),
+            orientation="horizontal",
+            pos_hint={"center_x": 0.5, "center_y": 0.5},
+            size_hint_x=0.5,
+            size_hint_y=0.06,
+        )
+        return snackbar
+
+    def _show_snackbar(self, snackbar):
+        # A snackbar still on screen cannot be added to the window a second time.
+        if snackbar.parent is None:
+            snackbar.open()
 
     def _has_active_pad_connection(self):
         return rlcu_socket.has_active_connection(self.pad_num)
\ No newline at end of file
@@ -4,6 +4,7 @@ Remote box consists of a key switch for local arming, and a toggle switch for la
 
 """
 
+import concurrent.futures
 import serial
 import serial.tools.list_ports
 import threading
@@ -15,6 +16,16 @@ TX_CONTINUITY = 0b00000100
 RX_ARM_HMI = 0b00000001
 RX_LAUNCH = 0b00000010
 
+# Prebuilt single-byte write buffers, indexed by mask value.
+_TX_BYTES = tuple(bytes((i,)) for i in range(256))
+
+# (arm_hmi, launch) flags decoded once per possible status byte.
+_RX_DECODE = tuple((bool(b & RX_ARM_HMI), bool(b & RX_LAUNCH)) for b in range(256))
+
+
+def _NOOP(payload):
+    """Default event callback used while nothing is registered."""
+
 
 class RLCUSerial:
     def __init__(self):
@@ -23,10 +34,14 @@ class RLCUSerial:
 
         self._listener_thread = None
         self._stop_event = threading.Event()
-        self._event_callback = None
+        self._event_callback = _NOOP
+        # Reused for every connect attempt; one worker also serializes concurrent connects.
+        self._connect_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="rlcu-serial"
+        )
 
         self._lock = threading.Lock()
-        self._tx_mask = 0
+        self._tx_mask = None            # last mask written, None until the first write
         self._rx_mask = 0
 
     def get_serial_ports(self):
@@ -37,32 +52,38 @@ class RLCUSerial:
             for port in ports
         ]
 
-    def connect(self, port, baudrate, on_success, on_fail):
-        """Connect to the serial port in a separate thread, calling callbacks on success/failure."""
-
-        def connect_thread():
-            try:
-                print(f"DEBUG: Opening serial port {port} at {baudrate} baud")
-                if self._serial_obj is not None and self._serial_obj.is_open:
-                    self._serial_obj.close()
-                self._serial_obj = serial.Serial(port, baudrate, timeout=1)
-                print(f"DEBUG: Serial port opened: {self._serial_obj.is_open}")
-                self.connected = True
-                self._stop_event.clear()
-                self._listener_thread = threading.Thread(
-                    target=self._listen_serial, daemon=True
-                )
-                self._listener_thread.start()
-                on_success()
-            except Exception as exc:  # pylint: disable=broad-except
-                self.connected = False
-                on_fail(str(exc))
-
-        threading.Thread(target=connect_thread, daemon=True).start()
+    def connect_sync(self, port, baudrate):
+        """Open the serial port and start the listener, raising on failure. Blocks the caller."""
+        print(f"DEBUG: Opening serial port {port} at {baudrate} baud")
+        try:
+            if self._serial_obj is not None and self._serial_obj.is_open:
+                self._serial_obj.close()
+            self._serial_obj = serial.Serial(port, baudrate, timeout=1)
+        except Exception:
+            self.connected = False
+            raise
+        print(f"DEBUG: Serial port opened: {self._serial_obj.is_open}")
+        with self._lock:
+            self._tx_mask = None
+        self.connected = True
+        self._stop_event.clear()
+        self._listener_thread = threading.Thread(
+            target=self._listen_serial, daemon=True
+        )
+        self._listener_thread.start()
+
+    def connect(self, port, baudrate):
+        """Run `connect_sync` on the serial worker thread and return its Future."""
+        return self._connect_pool.submit(self.connect_sync, port, baudrate)
 
     def disconnect(self):
         """Disconnect from the serial port and reset state."""
         if self._serial_obj is not None and self._serial_obj.is_open:
+            try:
+                # Let pending status bytes leave before the port goes away.
+                self._serial_obj.flush()
+            except Exception as exc:  # pylint: disable=broad-except
+                print(f"DEBUG: Serial flush failed: {exc}")
             self._serial_obj.close()
         self._serial_obj = None
         self.connected = False
@@ -70,9 +91,9 @@ class RLCUSerial:
         if self._listener_thread and self._listener_thread.is_alive():
             self._listener_thread.join(timeout=1.0)
         with self._lock:
-            self._tx_mask = 0
+            self._tx_mask = None
             self._rx_mask = 0
-        self._event_callback = None
+        self._event_callback = _NOOP
 
     def is_serial_open(self):
         """Check if the serial port is currently open."""
@@ -80,7 +101,7 @@ class RLCUSerial:
 
     def register_event_callback(self, callback):
         """Register a callable that receives event dictionaries from the ESP32."""
-        self._event_callback = callback
+        self._event_callback = callback or _NOOP
 
     def send_status_update(self, arm_pad, arm_hmi, continuity):
         """
@@ -94,6 +115,8 @@ class RLCUSerial:
         if continuity:
             mask |= TX_CONTINUITY
         with self._lock:
+            if mask == self._tx_mask:
+                return
             self._tx_mask = mask
         self._write_byte(mask)
 
@@ -101,48 +124,58 @@ class RLCUSerial:
         """Write a single byte to the ESP32."""
         if self._serial_obj and self._serial_obj.is_open:
             try:
-                self._serial_obj.write(bytes([value & 0xFF]))
-                self._serial_obj.flush()
+                self._serial_obj.write(_TX_BYTES[value & 0xFF])
             except Exception as exc:  # pylint: disable=broad-except
                 print(f"DEBUG: Serial write failed: {exc}")
 
     def _listen_serial(self):
         """Continuously consume bytes emitted by the ESP32."""
-        while not self._stop_event.is_set():
-            try:
+        # Any error ends the listener, so a single handler around the loop is enough.
+        try:
+            while not self._stop_event.is_set():
                 if not (self._serial_obj and self._serial_obj.is_open):
                     break
-                raw = self._serial_obj.read(1)
-                if not raw:
-                    continue
-                self._handle_rx_byte(raw[0])
-            except Exception as exc:  # pylint: disable=broad-except
-                if not self._stop_event.is_set():
-                    print(f"DEBUG: Serial listener error: {exc}")
-                break
-
-    def _handle_rx_byte(self, byte):
-        """Handle received byte and detect edges for launch signal."""
+                # Drain everything already buffered in one call; block for one byte when idle.
+                chunk = self._serial_obj.read(self._serial_obj.in_waiting or 1)
+                if chunk:
+                    self._handle_rx_chunk(chunk)
+        except Exception as exc:  # pylint: disable=broad-except
+            if not self._stop_event.is_set():
+                print(f"DEBUG: Serial listener error: {exc}")
+
+    def _handle_rx_chunk(self, chunk):
+        """Collapse a burst of status bytes into one event and detect launch edges."""
+        final = chunk[-1]
         with self._lock:
             prev_mask = self._rx_mask
-            if byte == prev_mask:
-                return
-            self._rx_mask = byte
+            self._rx_mask = final
+        # Only the last byte's state matters, but a launch press inside the burst must not be lost.
+        launch_edge = False
+        was_launch = _RX_DECODE[prev_mask][1]
+        for byte in chunk:
+            launch = _RX_DECODE[byte][1]
+            if launch and not was_launch:
+                launch_edge = True
+                break
+            was_launch = launch
+        if final == prev_mask and not launch_edge:
+            return
+        arm_hmi, launch = _RX_DECODE[final]
+        # A fresh dict per event: callbacks may hand it to another thread.
         payload = {
             "type": "status",
-            "arm_hmi": bool(byte & RX_ARM_HMI),
-            "launch": bool(byte & RX_LAUNCH),
-            "launch_edge": bool((byte & RX_LAUNCH) and not (prev_mask & RX_LAUNCH)),
+            "arm_hmi": arm_hmi,
+            "launch": launch,
+            "launch_edge": launch_edge,
         }
         self._emit_event(payload)
 
     def _emit_event(self, payload):
-        """Invoke the registered callback (if any) with the latest payload."""
-        if self._event_callback:
-            try:
-                self._event_callback(payload)
-            except Exception as exc:  # pylint: disable=broad-except
-                print(f"DEBUG: Serial callback error: {exc}")
+        """Invoke the registered callback with the latest payload."""
+        try:
+            self._event_callback(payload)
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"DEBUG: Serial callback error: {exc}")
 
 
 rlcu_serial = RLCUSerial()
\ No newline at end of file
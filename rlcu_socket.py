@@ -2,23 +2,68 @@
 This module handles socket-based communication with the RLCU pads.
 
 Pads announce themselves over UDP and, when authenticated, accept a TCP connection
-for streaming telemetry. Each pad gets a dedicated worker responsible for keeping
-its TCP session alive, parsing telemetry frames, and exposing a simple command path
-for the UI to use.
+for streaming telemetry. A single reactor thread multiplexes the discovery socket and
+every pad's TCP session, keeping sessions alive, parsing telemetry frames and
+reconnecting dropped pads; the UI gets a simple command path on top.
 """
 
+import errno
+import heapq
+import hmac
+import logging
+import os
+import selectors
 import socket
 import struct
 import threading
 import time
-from globals import pad_data, pad_data_lock, n_pads
+from array import array
+from globals import n_pads, mark_pad_seen, queue_pad_update
 
 
+_log = logging.getLogger("rlcu")
+
 AUTH_KEY = "RLCU!2025"
 DISCOVERY_STRUCT = struct.Struct("!B16s")   # pad id + 16-byte auth key
+_AUTH_KEY_BYTES = AUTH_KEY.encode("ascii").ljust(16, b"\x00")  # key as it appears on the wire
 TELEMETRY_STRUCT = struct.Struct("<ff??Bx")  # voltage, rssi, rbf, continuity, igniter, pad
 TELEMETRY_TIMEOUT = 10.0                    # seconds without data before reconnect
+CONNECT_TIMEOUT = 2.0                       # seconds a TCP connect may stay pending
 RECONNECT_DELAY = 2.0                       # delay between reconnect attempts
+RX_BUFFER_SIZE = 4096                       # per-pad telemetry receive buffer
+
+# Prebuilt single-byte command payloads, indexed by mask value.
+_PAYLOADS = tuple(bytes((i,)) for i in range(256))
+
+# RSSI colour per whole dBm over the int8 range, indexed by int(rssi) & 0xFF.
+_RSSI_COLOR = ["red"] * 256
+for _dbm in range(-69, 128):
+    _RSSI_COLOR[_dbm & 0xFF] = "green" if _dbm > -50 else "yellow"
+del _dbm
+_CONTINUITY_COLOR = ("red", "green")    # indexed by the continuity flag
+_ARM_COLOR = ("green", "red")           # indexed by the RBF/arm flag
+
+
+class _TelemetryLink:
+    """TCP session with one pad, owned by the reactor thread."""
+
+    __slots__ = (
+        "pad_num", "ip_address", "conn", "connected",
+        "buffer", "view", "read_pos", "write_pos", "last_data_ts", "last_frame",
+    )
+
+    def __init__(self, pad_num, ip_address, conn):
+        self.pad_num = pad_num
+        self.ip_address = ip_address
+        self.conn = conn
+        self.connected = False          # True once the non-blocking connect completed
+        # Fixed buffer filled by recv_into; bytes between the cursors are still unparsed.
+        self.buffer = bytearray(RX_BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.read_pos = 0
+        self.write_pos = 0
+        self.last_data_ts = time.monotonic()
+        self.last_frame = None          # last decoded telemetry tuple applied to the pad
 
 
 class RLCUSocket:
@@ -28,31 +73,36 @@ class RLCUSocket:
         self.unicast_tx_mode = False
 
         self._udp_sock = None
-        self._udp_thread = None
+        self._reactor_thread = None
         self._stop_event = threading.Event()
+        self._wake_w = None             # write end of the reactor's wake-up socketpair
+
+        # Reactor-thread state
+        self._selector = None
+        self._links = {}                # ip -> _TelemetryLink
+        self._reconnects = []           # heap of (due, ip, pad_num)
+        self._pending_ips = set()       # ips waiting in the reconnect heap
 
-        self._connections_lock = threading.Lock()
-        self._connections = {}          # ip -> socket
-        self._connection_threads = {}   # ip -> thread
+        # Written only by the reactor; single-key reads need no lock.
+        self._pad_conn = {}             # pad_num -> live TCP socket
         self._pad_peers = {}            # pad_num -> ip
 
         self.listening = False
 
-        self._timer_thread = threading.Thread(target=self._timer_loop, daemon=True)
-        self._timer_thread.start()
-
         # Command bit flags
         self.CMD_RDY_TO_FIRE = 0b00000001
         self.CMD_LAUNCH = 0b00000010
         self.CMD_LED = 0b00000100
         self.CMD_BUZZER = 0b00001000
 
-        self._command_lock = threading.Lock()
-        self._command_state = {i: 0 for i in range(n_pads)}
+        # One lock per pad so commands and status reads for different pads never contend.
+        self._pad_locks = [threading.Lock() for _ in range(n_pads)]
+        self._command_state = bytearray(n_pads)
+        self._last_sent_mask = {}       # pad_num -> mask the pad last received
         # Track the last command mask per pad together with delivery status metadata.
-        self._command_history = {
-            i: {"mask": 0, "success": False, "timestamp": 0.0} for i in range(n_pads)
-        }
+        self._cmd_mask = bytearray(n_pads)
+        self._cmd_success = bytearray(n_pads)
+        self._cmd_timestamp = array("d", [0.0] * n_pads)
 
 
 
@@ -82,20 +132,14 @@ class RLCUSocket:
         When *enable* is None the command is treated as momentary (one-shot) and
         only OR’d into the transmitted mask.
         """
-        with pad_data_lock:
-            ip_address = pad_data.get(pad_num).ip_address if pad_num in pad_data else ""
-        if not ip_address:
-            print(f"INFO: Command skipped for pad {pad_num}: no IP address")
-            return False
-
-        with self._connections_lock:
-            conn = self._connections.get(ip_address)
+        conn = self._pad_conn.get(pad_num)
         if not conn:
-            print(f"INFO: Command skipped for pad {pad_num}: no active TCP connection")
+            _log.info("Command skipped for pad %d: no active TCP connection", pad_num)
             return False
+        ip_address = self._pad_peers.get(pad_num, "")
 
-        with self._command_lock:
-            state = self._command_state.get(pad_num, 0)
+        with self._pad_locks[pad_num]:
+            state = self._command_state[pad_num]
             original_state = state
             if enable is True and command:
                 state |= command
@@ -106,56 +150,61 @@ class RLCUSocket:
                 mask = state
             else:
                 mask = state | (command if command else 0)
+            # Latched commands the pad already holds need no write; momentary ones always go out.
+            if enable is not None and mask == self._last_sent_mask.get(pad_num):
+                return True
 
-        print(
-            f"INFO: send_command -> pad={pad_num}, ip={ip_address}, "
-            f"base_state=0b{original_state:08b}, command=0b{(command or 0):08b}, "
-            f"enable={enable}, mask=0b{mask:08b}"
+        _log.debug(
+            "send_command -> pad=%d, ip=%s, base_state=0x%02x, command=0x%02x, enable=%s, mask=0x%02x",
+            pad_num, ip_address, original_state, command or 0, enable, mask,
         )
 
-        payload = bytes([mask & 0xFF])
         try:
-            conn.sendall(payload)
-            with self._command_lock:
-                self._command_history[pad_num] = {
-                    "mask": mask,
-                    "success": True,
-                    "timestamp": time.time(),
-                }
+            conn.sendall(_PAYLOADS[mask & 0xFF])
+            with self._pad_locks[pad_num]:
+                self._last_sent_mask[pad_num] = mask
+                self._record_command(pad_num, mask, True)
             return True
         except OSError as exc:
-            print(f"DEBUG: Failed to send command to pad {pad_num} ({exc})")
-            with self._command_lock:
-                self._command_history[pad_num] = {
-                    "mask": mask,
-                    "success": False,
-                    "timestamp": time.time(),
-                }
+            _log.warning("Failed to send command to pad %d (%s)", pad_num, exc)
+            with self._pad_locks[pad_num]:
+                self._record_command(pad_num, mask, False)
             return False
 
     def get_last_command_status(self, pad_num):
         """Return the most recent command state for a pad."""
-        with self._command_lock:
-            return dict(self._command_history.get(pad_num, {}))
+        if not 0 <= pad_num < n_pads:
+            return {}
+        with self._pad_locks[pad_num]:
+            return {
+                "mask": self._cmd_mask[pad_num],
+                "success": bool(self._cmd_success[pad_num]),
+                "timestamp": self._cmd_timestamp[pad_num],
+            }
+
+    def _record_command(self, pad_num, mask, success):
+        """Store the delivery status of a command; callers hold the pad's lock."""
+        self._cmd_mask[pad_num] = mask & 0xFF
+        self._cmd_success[pad_num] = success
+        self._cmd_timestamp[pad_num] = time.time()
 
     def has_active_connection(self, pad_num):
         """Check if there is an active TCP connection for the given pad."""
-        with pad_data_lock:
-            pad = pad_data.get(pad_num)
-            ip_address = pad.ip_address if pad else ""
-        if not ip_address:
-            return False
-        with self._connections_lock:
-            return ip_address in self._connections
+        return pad_num in self._pad_conn
 
     def start_listening(self):
-        """Start asynchronous UDP discovery."""
+        """Start the reactor serving UDP discovery and pad telemetry."""
         if self.listening:
             return
         self.listening = True
         self._stop_event.clear()
-        self._udp_thread = threading.Thread(target=self._udp_loop, name="RLCU-UDP", daemon=True)
-        self._udp_thread.start()
+        # A socketpair rather than os.pipe: select() on Windows only accepts sockets.
+        wake_r, self._wake_w = socket.socketpair()
+        wake_r.setblocking(False)
+        self._reactor_thread = threading.Thread(
+            target=self._reactor_loop, args=(wake_r,), name="RLCU-Reactor", daemon=True
+        )
+        self._reactor_thread.start()
 
     def stop_listening(self):
         """Stop discovery and tear down every TCP session."""
@@ -163,52 +212,62 @@ class RLCUSocket:
             return
         self.listening = False
         self._stop_event.set()
-
-        if self._udp_sock:
-            try:
-                self._udp_sock.close()
-            except OSError:
-                pass
-            self._udp_sock = None
-
-        if self._udp_thread and self._udp_thread.is_alive():
-            self._udp_thread.join(timeout=1.0)
-        self._udp_thread = None
-
-        with self._connections_lock:
-            for ip, conn in list(self._connections.items()):
-                try:
-                    conn.close()
-                except OSError:
-                    pass
-            self._connections.clear()
-
-        for ip, thread in list(self._connection_threads.items()):
-            if thread.is_alive():
-                thread.join(timeout=1.0)
-        self._connection_threads.clear()
+        try:
+            self._wake_w.send(b"x")
+        except OSError:
+            pass
+
+        # The woken reactor closes its own sockets.
+        if self._reactor_thread and self._reactor_thread.is_alive():
+            self._reactor_thread.join(timeout=1.0)
+        self._reactor_thread = None
+        self._wake_w.close()
+        self._wake_w = None
         self._pad_peers.clear()
-        with self._command_lock:
-            self._command_state = {i: 0 for i in range(n_pads)}
-            self._command_history = {
-                i: {"mask": 0, "success": False, "timestamp": time.time()}
-                for i in range(n_pads)
-            }
-        self._stop_event.clear()
-
-    def _udp_loop(self):
-        """Listen for discovery packets and spawn per-pad TCP workers."""
+        now = time.time()
+        for pad_num, lock in enumerate(self._pad_locks):
+            with lock:
+                self._command_state[pad_num] = 0
+                self._last_sent_mask.pop(pad_num, None)
+                self._cmd_mask[pad_num] = 0
+                self._cmd_success[pad_num] = False
+                self._cmd_timestamp[pad_num] = now
+
+    def _reactor_loop(self, wake_r):
+        """Serve discovery, telemetry and reconnects for every pad from one thread."""
+        self._selector = selectors.DefaultSelector()
         try:
+            self._selector.register(wake_r, selectors.EVENT_READ, None)
             self._udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
             self._udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):  # not available on Windows
+                self._udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
             self._udp_sock.bind(("", self.port))
+            self._udp_sock.setblocking(False)
+            self._selector.register(self._udp_sock, selectors.EVENT_READ, None)
             while not self._stop_event.is_set():
-                try:
-                    data, addr = self._udp_sock.recvfrom(1024)
-                except OSError:
-                    break
-                self._handle_discovery(data, addr)
+                self._run_due_reconnects()
+                # Sleep until a socket is ready, a deadline passes or stop_listening wakes us.
+                for key, events in self._selector.select(self._next_timeout()):
+                    if key.fileobj is wake_r:
+                        continue
+                    if key.data is None:
+                        self._on_discovery_readable()
+                    elif events & selectors.EVENT_WRITE:
+                        self._on_connect_ready(key.data)
+                    else:
+                        self._on_telemetry_readable(key.data)
+                self._expire_idle_links()
+        except OSError as exc:
+            _log.error("Socket reactor error (%s)", exc)
         finally:
+            for link in list(self._links.values()):
+                self._close_link(link, reconnect=False)
+            self._reconnects.clear()
+            self._pending_ips.clear()
+            self._selector.close()
+            self._selector = None
+            wake_r.close()
             if self._udp_sock:
                 try:
                     self._udp_sock.close()
@@ -216,174 +275,211 @@ class RLCUSocket:
                     pass
                 self._udp_sock = None
 
+    def _on_discovery_readable(self):
+        try:
+            data, addr = self._udp_sock.recvfrom(1024)
+        except OSError:
+            return
+        self._handle_discovery(data, addr)
+
     def _handle_discovery(self, data, addr):
-        """Validate discovery/authentication packets and ensure a TCP worker exists."""
+        """Validate discovery/authentication packets and ensure a TCP session exists."""
         ip_address = addr[0]
         if len(data) < DISCOVERY_STRUCT.size:
-            print(f"DEBUG: Ignoring short discovery from {ip_address}")
+            _log.debug("Ignoring short discovery from %s", ip_address)
             return
 
-        pad_num, raw_auth = DISCOVERY_STRUCT.unpack_from(data)
-        auth_key = raw_auth.split(b"\x00", 1)[0].decode("ascii", errors="ignore")
-
-        if auth_key != AUTH_KEY:
-            print(f"DEBUG: Ignoring discovery from {ip_address}: invalid auth")
-            return
+        # The pad id is the first byte; reject bad ids before touching the key.
+        pad_num = data[0]
         if pad_num >= n_pads:
-            print(f"DEBUG: Ignoring discovery from {ip_address}: invalid pad index {pad_num}")
+            _log.debug("Ignoring discovery from %s: invalid pad index %d", ip_address, pad_num)
+            return
+        if not hmac.compare_digest(memoryview(data)[1:DISCOVERY_STRUCT.size], _AUTH_KEY_BYTES):
+            _log.debug("Ignoring discovery from %s: invalid auth", ip_address)
             return
 
-        with pad_data_lock:
-            pad = pad_data.get(pad_num)
-            if pad:
-                pad.ip_address = ip_address
-                pad.last_seen = 0
-                pad.last_seen_color = "black"
+        mark_pad_seen(pad_num)
+        queue_pad_update(pad_num, ip_address=ip_address)
 
         self._pad_peers[pad_num] = ip_address
         self._ensure_connection(pad_num, ip_address)
 
     def _ensure_connection(self, pad_num, ip_address):
-        """Create (or reuse) a TCP worker thread for a pad."""
-        with self._connections_lock:
-            worker = self._connection_threads.get(ip_address)
-            if worker and worker.is_alive():
-                return
+        """Open a TCP session for a pad unless one is live, connecting or pending a retry."""
+        if ip_address in self._links or ip_address in self._pending_ips:
+            return
+        self._open_link(pad_num, ip_address)
 
-        thread = threading.Thread(
-            target=self._connection_worker, args=(pad_num, ip_address), daemon=True, name=f"RLCU-TCP-{ip_address}"
-        )
-        with self._connections_lock:
-            self._connection_threads[ip_address] = thread
-        thread.start()
-
-    def _connection_worker(self, pad_num, ip_address):
-        """Keep a live TCP session with a pad, reconnecting on failures."""
-        while self.listening and not self._stop_event.is_set():
-            conn = None
-            try:
-                conn = socket.create_connection((ip_address, self.port), timeout=2.0)
-                conn.settimeout(1.0)
-                with self._connections_lock:
-                    self._connections[ip_address] = conn
-                with self._command_lock:
-                    mask = self._command_state.get(pad_num, 0)
-                try:
-                    conn.sendall(bytes([mask & 0xFF]))
-                    with self._command_lock:
-                        # Successful reconnection should re-confirm the stored command mask.
-                        self._command_history[pad_num] = {
-                            "mask": mask,
-                            "success": True,
-                            "timestamp": time.time(),
-                        }
-                except OSError as exc:
-                    print(f"DEBUG: Failed to sync command mask to {ip_address} ({exc})")
-                    with self._command_lock:
-                        self._command_history[pad_num] = {
-                            "mask": mask,
-                            "success": False,
-                            "timestamp": time.time(),
-                        }
-                self._telemetry_loop(pad_num, ip_address, conn)
-            except OSError as exc:
-                print(f"DEBUG: TCP error with {ip_address} ({exc})")
-            finally:
-                if conn:
-                    try:
-                        conn.close()
-                    except OSError:
-                        pass
-                with self._connections_lock:
-                    self._connections.pop(ip_address, None)
-
-            if not self.listening or self._stop_event.is_set():
-                break
-            time.sleep(RECONNECT_DELAY)
-
-        with self._connections_lock:
-            self._connection_threads.pop(ip_address, None)
-
-    def _telemetry_loop(self, pad_num, ip_address, conn):
-        """Read and apply telemetry frames until the link drops."""
-        buffer = bytearray()
-        last_data_ts = time.time()
-
-        while self.listening and not self._stop_event.is_set():
+    def _open_link(self, pad_num, ip_address):
+        """Start a non-blocking connect to a pad; the reactor finishes it on write-readiness."""
+        conn = None
+        try:
+            conn = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            conn.setblocking(False)
+            # Command bytes are single control messages; never hold them back for coalescing.
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            err = conn.connect_ex((ip_address, self.port))
+            if err not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                raise OSError(err, os.strerror(err))
+        except OSError as exc:
+            _log.info("TCP error with %s (%s)", ip_address, exc)
+            if conn is not None:
+                conn.close()
+            self._schedule_reconnect(pad_num, ip_address)
+            return
+
+        link = _TelemetryLink(pad_num, ip_address, conn)
+        self._links[ip_address] = link
+        self._selector.register(conn, selectors.EVENT_WRITE, link)
+
+    def _on_connect_ready(self, link):
+        """Finish a pending connect, resync the pad's command mask and start reading."""
+        err = link.conn.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+        if err:
+            _log.info("TCP error with %s (%s)", link.ip_address, os.strerror(err))
+            self._close_link(link)
+            return
+
+        pad_num = link.pad_num
+        conn = link.conn
+        with self._pad_locks[pad_num]:
+            mask = self._command_state[pad_num]
+        try:
+            conn.sendall(_PAYLOADS[mask])
+            with self._pad_locks[pad_num]:
+                self._last_sent_mask[pad_num] = mask
+                # Successful reconnection should re-confirm the stored command mask.
+                self._record_command(pad_num, mask, True)
+        except OSError as exc:
+            _log.warning("Failed to sync command mask to %s (%s)", link.ip_address, exc)
+            with self._pad_locks[pad_num]:
+                self._record_command(pad_num, mask, False)
+
+        link.connected = True
+        link.last_data_ts = time.monotonic()
+        self._pad_conn[pad_num] = conn
+        self._selector.modify(conn, selectors.EVENT_READ, link)
+
+    def _close_link(self, link, reconnect=True):
+        """Drop a pad's TCP session and, while listening, queue a reconnect."""
+        self._links.pop(link.ip_address, None)
+        if self._pad_conn.get(link.pad_num) is link.conn:
+            del self._pad_conn[link.pad_num]
+            with self._pad_locks[link.pad_num]:
+                self._last_sent_mask.pop(link.pad_num, None)
+        try:
+            self._selector.unregister(link.conn)
+        except (KeyError, ValueError):
+            pass
+        try:
+            link.conn.close()
+        except OSError:
+            pass
+        if reconnect and self.listening and not self._stop_event.is_set():
+            self._schedule_reconnect(link.pad_num, link.ip_address)
+
+    def _schedule_reconnect(self, pad_num, ip_address):
+        self._pending_ips.add(ip_address)
+        heapq.heappush(self._reconnects, (time.monotonic() + RECONNECT_DELAY, ip_address, pad_num))
+
+    def _run_due_reconnects(self):
+        """Retry every reconnect that is due."""
+        now = time.monotonic()
+        while self._reconnects and self._reconnects[0][0] <= now:
+            _, ip_address, pad_num = heapq.heappop(self._reconnects)
+            self._pending_ips.discard(ip_address)
+            if ip_address not in self._links:
+                self._open_link(pad_num, ip_address)
+            now = time.monotonic()
+
+    def _next_timeout(self):
+        """Seconds until the next reconnect or link deadline, or None to sleep until woken."""
+        deadlines = [due for due, _, _ in self._reconnects[:1]]
+        for link in self._links.values():
+            limit = TELEMETRY_TIMEOUT if link.connected else CONNECT_TIMEOUT
+            deadlines.append(link.last_data_ts + limit)
+        if not deadlines:
+            return None
+        return max(0.0, min(deadlines) - time.monotonic())
+
+    def _on_telemetry_readable(self, link):
+        """Drain what the pad has queued and apply every complete telemetry frame."""
+        while True:
+            space = RX_BUFFER_SIZE - link.write_pos
             try:
-                chunk = conn.recv(TELEMETRY_STRUCT.size - len(buffer))
-            except socket.timeout:
-                chunk = None
+                count = link.conn.recv_into(link.view[link.write_pos:])
+            except BlockingIOError:
+                return
             except OSError as exc:
-                print(f"DEBUG: Telemetry receive error from {ip_address} ({exc})")
-                break
-
-            if chunk:
-                buffer.extend(chunk)
-                last_data_ts = time.time()
-                while len(buffer) >= TELEMETRY_STRUCT.size:
-                    frame = bytes(buffer[:TELEMETRY_STRUCT.size])
-                    del buffer[:TELEMETRY_STRUCT.size]
-                    telemetry = self._parse_telemetry(frame)
-                    self._apply_telemetry(pad_num, ip_address, telemetry)
-            elif chunk is None:
-                pass
-            else:  # peer closed
-                print(f"DEBUG: Telemetry connection closed by {ip_address}")
-                break
-
-            if time.time() - last_data_ts >= TELEMETRY_TIMEOUT:
-                print(f"DEBUG: Telemetry timeout for {ip_address}")
-                break
-
-    def _parse_telemetry(self, frame):
-        """Decode a telemetry record."""
-        if len(frame) != TELEMETRY_STRUCT.size:
-            raise ValueError("Telemetry frame size mismatch")
-        voltage, rssi, rbf_status, squib_continuity, igniter_id = TELEMETRY_STRUCT.unpack(frame)
-        return {
-            "voltage": voltage,
-            "rssi": rssi,
-            "rbf_status": bool(rbf_status),
-            "squib_continuity": bool(squib_continuity),
-            "igniter_id": igniter_id,
-        }
-
-    def _apply_telemetry(self, pad_num, ip_address, telemetry):
-        """Update shared pad data from a telemetry frame."""
-        with pad_data_lock:
-            pad = pad_data.get(pad_num)
-            if not pad:
+                _log.warning("Telemetry receive error from %s (%s)", link.ip_address, exc)
+                self._close_link(link)
+                return
+            if not count:  # peer closed
+                _log.info("Telemetry connection closed by %s", link.ip_address)
+                self._close_link(link)
                 return
-            pad.ip_address = ip_address
-            pad.last_seen = 0
-            pad.last_seen_color = "black"
-
-            pad.voltage = telemetry["voltage"]
-            pad.voltage_color = "green" if pad.voltage >= 10.0 else "red"
-
-            pad.rssi = telemetry["rssi"]
-            if pad.rssi > -50:
-                pad.rssi_color = "green"
-            elif pad.rssi > -70:
-                pad.rssi_color = "yellow"
-            else:
-                pad.rssi_color = "red"
-
-            pad.continuity = telemetry["squib_continuity"]
-            pad.continuity_color = "green" if pad.continuity else "red"
 
-            pad.arm_status = telemetry["rbf_status"]
-            pad.arm_color = "red" if pad.arm_status else "green"
+            link.last_data_ts = time.monotonic()
+            mark_pad_seen(link.pad_num)
+            self._apply_frames(link, count)
+            # A short read means the kernel queue is empty; skip the EAGAIN probe.
+            if count < space:
+                return
 
-    def _timer_loop(self):
-        """Increment last_seen counters once per second for UI staleness indicators."""
-        while True:
-            time.sleep(1)
-            with pad_data_lock:
-                for pad in pad_data.values():
-                    pad.last_seen += 1
-                    pad.last_seen_color = "red" if pad.last_seen > 30 else "black"
+    def _apply_frames(self, link, count):
+        """Decode the frames completed by *count* new bytes and rewind the cursors."""
+        buffer = link.buffer
+        size = TELEMETRY_STRUCT.size
+        read_pos = link.read_pos
+        write_pos = link.write_pos + count
+        while write_pos - read_pos >= size:
+            # Decode straight from the buffer: no frame copy, no intermediate dict.
+            frame = TELEMETRY_STRUCT.unpack_from(buffer, read_pos)
+            read_pos += size
+            # An idle pad repeats the same frame; only changes reach the pad data.
+            if frame != link.last_frame:
+                link.last_frame = frame
+                self._apply_telemetry(link.pad_num, link.ip_address, *frame)
+
+        # Rewind once the tail of a partial frame is all that is left past the midpoint.
+        if read_pos == write_pos:
+            read_pos = write_pos = 0
+        elif read_pos > RX_BUFFER_SIZE // 2:
+            buffer[:write_pos - read_pos] = buffer[read_pos:write_pos]
+            write_pos -= read_pos
+            read_pos = 0
+        link.read_pos = read_pos
+        link.write_pos = write_pos
+
+    def _expire_idle_links(self):
+        now = time.monotonic()
+        for link in list(self._links.values()):
+            if not link.connected:
+                if now - link.last_data_ts >= CONNECT_TIMEOUT:
+                    _log.info("TCP error with %s (connect timed out)", link.ip_address)
+                    self._close_link(link)
+            elif now - link.last_data_ts >= TELEMETRY_TIMEOUT:
+                _log.warning("Telemetry timeout for %s", link.ip_address)
+                self._close_link(link)
+
+    def _apply_telemetry(self, pad_num, ip_address, voltage, rssi, rbf_status, squib_continuity, igniter_id):
+        """Update shared pad data from the decoded fields of a telemetry frame."""
+        if -128 < rssi < 128:
+            rssi_color = _RSSI_COLOR[int(rssi) & 0xFF]
+        else:  # out of int8 range, inf or NaN
+            rssi_color = "green" if rssi > 0 else "red"
+        queue_pad_update(
+            pad_num,
+            ip_address=ip_address,
+            voltage=voltage,
+            voltage_color="green" if voltage >= 10.0 else "red",
+            rssi=rssi,
+            rssi_color=rssi_color,
+            continuity=squib_continuity,
+            continuity_color=_CONTINUITY_COLOR[squib_continuity],
+            arm_status=rbf_status,
+            arm_color=_ARM_COLOR[rbf_status],
+        )
 
 
 rlcu_socket = RLCUSocket()
@@ -1,3 +1,5 @@
+import time
+
 # Kivy imports
 from kivy.clock import Clock
 
@@ -24,14 +26,36 @@ class SerialDialog(MDBoxLayout):
     Handles COM port and baudrate selection, connection/disconnection.
     """
 
+    # Port scan shared by dialogs opened in quick succession
+    COM_PORTS_TTL = 2.0
+    _com_ports_cache = None
+    _cache_ts = 0.0
+
+    _error_dialog = None
+    _error_label = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._setup_dropdowns()
 
+    @classmethod
+    def _get_com_ports(cls):
+        """Return the serial ports, rescanning only when the cached scan is stale."""
+        now = time.monotonic()
+        if cls._com_ports_cache is None or now - cls._cache_ts > cls.COM_PORTS_TTL:
+            cls._com_ports_cache = rlcu_serial.get_serial_ports()
+            cls._cache_ts = now
+        return cls._com_ports_cache
+
+    @classmethod
+    def invalidate_com_ports(cls):
+        """Force the next dialog to rescan the serial ports."""
+        cls._com_ports_cache = None
+
     def _setup_dropdowns(self):
         """Initialize and bind COM-port and baudrate dropdown menus for reuse."""
         # COM port dropdown
-        com_ports = rlcu_serial.get_serial_ports()
+        com_ports = self._get_com_ports()
         if not com_ports:
             com_ports = [{"device": "No ports found", "description": ""}]
         self.selected_com_port = com_ports[0]["device"]
@@ -97,34 +121,28 @@ class SerialDialog(MDBoxLayout):
         port = str(self.selected_com_port)
         baud = int(self.selected_baudrate)
 
-        connect_btn = self.connect_btn
-        cancel_btn = self.cancel_btn
-        connect_btn.children[0].text = "Connecting..."
-        cancel_btn.disabled = True
-
-        def on_success():
-            def do_success(dt):
-                # Restore button state and refresh the overview status indicator.
-                connect_btn.children[0].text = "Connect"
-                cancel_btn.disabled = False
-                overview = MDApp.get_running_app().root.get_screen("overview")
-                overview.update_serial_label_color()
-                self.dismiss()
+        self.connect_btn.children[0].text = "Connecting..."
+        self.cancel_btn.disabled = True
 
-            Clock.schedule_once(do_success, 0)
+        def on_done(future):
+            # Runs on the serial worker; hand the outcome back to the Kivy thread.
+            exc = future.exception()
+            Clock.schedule_once(lambda dt: self._on_connect_done(exc), 0)
 
-        def on_fail(err_msg):
-            def do_fail(dt):
-                # Surface connection errors while keeping the dialog open.
-                connect_btn.children[0].text = "Connect"
-                cancel_btn.disabled = False
-                overview = MDApp.get_running_app().root.get_screen("overview")
-                overview.update_serial_label_color()
-                self.show_connection_error(err_msg)
+        rlcu_serial.connect(port, baud).add_done_callback(on_done)
 
-            Clock.schedule_once(do_fail, 0)
-
-        rlcu_serial.connect(port, baud, on_success, on_fail)
+    def _on_connect_done(self, exc):
+        """Restore the buttons and close the dialog or surface the connection error."""
+        self.connect_btn.children[0].text = "Connect"
+        self.cancel_btn.disabled = False
+        overview = MDApp.get_running_app().root.get_screen("overview")
+        overview.update_serial_label_color()
+        if exc is None:
+            self.dismiss()
+        else:
+            # Keep the dialog open so another port can be tried.
+            self.invalidate_com_ports()
+            self.show_connection_error(str(exc))
 
     def on_disconnect(self, *args):
         """Disconnect from the current serial port."""
@@ -135,23 +153,29 @@ class SerialDialog(MDBoxLayout):
 
     def show_connection_error(self, error_msg):
         """Display an error dialog for connection failures."""
-        error_dialog = MDDialog(
+        cls = type(self)
+        if cls._error_dialog is None:
+            cls._build_error_dialog()
+        cls._error_label.text = f"Failed to connect to serial port.\n{error_msg}"
+        # A still-open dialog just shows the new text.
+        if cls._error_dialog.parent is None:
+            cls._error_dialog.open()
+
+    @classmethod
+    def _build_error_dialog(cls):
+        """Build the error dialog once; later errors only swap its text."""
+        cls._error_label = MDLabel(halign="center")
+        cls._error_dialog = MDDialog(
             MDDialogHeadlineText(text="Connection Error"),
-            MDDialogContentContainer(
-                MDLabel(
-                    text=f"Failed to connect to serial port.\n{error_msg}",
-                    halign="center",
-                )
-            ),
+            MDDialogContentContainer(cls._error_label),
             MDDialogButtonContainer(
                 MDButton(
                     MDButtonText(text="OK"),
                     style="text",
-                    on_release=lambda x: error_dialog.dismiss(),
+                    on_release=lambda x: cls._error_dialog.dismiss(),
                 ),
             ),
         )
-        error_dialog.open()
 
     def dismiss(self):
         """Dismiss the settings dialog."""
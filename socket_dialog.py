@@ -23,6 +23,10 @@ class SocketDialog(MDBoxLayout):
     Dialog content for socket connection settings.
     Handles host and port selection.
     """
+
+    _error_dialog = None
+    _error_label = None
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._setup_fields()
@@ -62,23 +66,29 @@ class SocketDialog(MDBoxLayout):
 
     def show_save_error(self, error_msg):
         """Display an error dialog for connection failures."""
-        error_dialog = MDDialog(
+        cls = type(self)
+        if cls._error_dialog is None:
+            cls._build_error_dialog()
+        cls._error_label.text = f"Failed to save configuration.\n{error_msg}"
+        # A still-open dialog just shows the new text.
+        if cls._error_dialog.parent is None:
+            cls._error_dialog.open()
+
+    @classmethod
+    def _build_error_dialog(cls):
+        """Build the error dialog once; later errors only swap its text."""
+        cls._error_label = MDLabel(halign="center")
+        cls._error_dialog = MDDialog(
             MDDialogHeadlineText(text="Save Error"),
-            MDDialogContentContainer(
-                MDLabel(
-                    text=f"Failed to save configuration.\n{error_msg}",
-                    halign="center",
-                )
-            ),
+            MDDialogContentContainer(cls._error_label),
             MDDialogButtonContainer(
                 MDButton(
                     MDButtonText(text="OK"),
                     style="text",
-                    on_release=lambda x: error_dialog.dismiss(),
+                    on_release=lambda x: cls._error_dialog.dismiss(),
                 ),
             ),
         )
-        error_dialog.open()
 
     @classmethod
     def show(cls, screen):
@@ -1,15 +1,36 @@
 """Test harness simulating pad discovery, telemetry streaming, and command echoes."""
+import queue
+import selectors
 import socket
 import struct
+import sys
 import threading
 import time
 
 PORT = 5555
 AUTH_KEY = "RLCU!2025"
 BUFFER_SIZE = 1024
+DISCOVERY_STRUCT = struct.Struct("!B16s")
+# The key field as it appears on the wire, NUL-padded to its fixed width.
+_AUTH_KEY_PADDED = AUTH_KEY.encode("ascii").ljust(16, b"\x00")
 TELEMETRY_STRUCT = struct.Struct("<ff??Bx")
-connections_lock = threading.Lock()
-tcp_connections = {}
+_iter_telemetry = TELEMETRY_STRUCT.iter_unpack
+SELECT_TIMEOUT = 0.5
+TCP_RCVBUF_SIZE = 65536     # kernel buffer for telemetry bursts
+TCP_SNDBUF_SIZE = 4096      # commands are single bytes
+DISCOVERY_BATCH = 32        # discovery packets read per selector wakeup
+# Every discovery packet is received into the same buffer and parsed before the next.
+_discovery_buffer = bytearray(BUFFER_SIZE)
+_discovery_view = memoryview(_discovery_buffer)
+# One selector multiplexes discovery and every pad connection on a single thread.
+selector = selectors.DefaultSelector()
+tcp_connections = {}        # ip_address -> PadState
+# Decoded telemetry batches for log_writer, so stdout never stalls the select loop.
+_log_queue = queue.SimpleQueue()
+_TELEMETRY_LINE = (
+    b"Telemetry from %s: voltage=%.2fV, rssi=%.2f, rbf=%s, continuity=%s, id=%d\n"
+)
+_BOOL_TEXT = (b"False", b"True")
 COMMAND_INTERVAL = 2.0
 RDY_TO_FIRE = 1 << 0
 FIRE = 1 << 1
@@ -21,139 +42,180 @@ COMMAND_PATTERN = [
     LED,
     BUZZER,
 ]
+# Commands cycle with a bit mask, so the pattern length must stay a power of two.
+_COMMAND_MASK = len(COMMAND_PATTERN) - 1
+assert len(COMMAND_PATTERN) & _COMMAND_MASK == 0
+# Command bytes encoded once and shared by every connection.
+_COMMAND_BYTES = tuple(bytes((command,)) for command in COMMAND_PATTERN)
 
 def parse_payload(data: bytes):
-    fmt = "!B16s"
-    size = struct.calcsize(fmt)
-    if len(data) < size:
+    """Return the device id of a discovery packet, or None if its key does not match."""
+    if len(data) < DISCOVERY_STRUCT.size:
         raise ValueError("Packet too short")
-    device_id, auth_raw = struct.unpack(fmt, data[:size])
-    auth_key = auth_raw.split(b"\x00", 1)[0].decode("ascii", errors="ignore")
-    return device_id, auth_key
+    device_id, auth_raw = DISCOVERY_STRUCT.unpack_from(data)
+    # One fixed-length bytes compare; nothing is stripped or decoded.
+    if auth_raw != _AUTH_KEY_PADDED:
+        return None
+    return device_id
 
-def parse_telemetry(data: bytes):
-    payload = data[:TELEMETRY_STRUCT.size]
-    if len(payload) < TELEMETRY_STRUCT.size:
-        raise ValueError("Telemetry packet too short")
-    voltage, rssi, rbf_status, squib_continuity, igniter_id = TELEMETRY_STRUCT.unpack(payload)
-    return {
-        "voltage": voltage,
-        "rssi": rssi,
-        "rbf_status": bool(rbf_status),
-        "squib_continuity": bool(squib_continuity),
-        "igniter_id": igniter_id,
-    }
+class PadState:
+    """Per-connection bookkeeping, stored as the connection's selector data."""
 
-def recv_exact(sock: socket.socket, size: int) -> bytes:
-    buffer = bytearray()
-    while len(buffer) < size:
-        try:
-            chunk = sock.recv(size - len(buffer))
-        except socket.timeout:
-            raise TimeoutError("Telemetry receive timed out")
-        if not chunk:
-            raise ValueError("Telemetry connection closed prematurely")
-        buffer.extend(chunk)
-    return bytes(buffer)
+    __slots__ = (
+        "ip_address", "conn", "buffer", "view", "write_pos",
+        "last_data_ts", "last_command_ts", "command_idx",
+    )
+
+    def __init__(self, ip_address: str, conn: socket.socket):
+        self.ip_address = ip_address
+        self.conn = conn
+        # Received into in place; bytes past write_pos are stale.
+        self.buffer = bytearray(BUFFER_SIZE)
+        self.view = memoryview(self.buffer)
+        self.write_pos = 0
+        # Monotonic timestamps: wall-clock jumps must not fire commands or timeouts.
+        self.last_data_ts = time.monotonic()
+        self.last_command_ts = float("-inf")
+        self.command_idx = 0
+
+def log_writer():
+    """Format queued telemetry batches and write them to stdout until handed None."""
+    out = sys.stdout.buffer
+    while True:
+        item = _log_queue.get()
+        if item is None:
+            return
+        ip_address, frames = item
+        ip_bytes = ip_address.encode("ascii")
+        batch = b"".join(
+            _TELEMETRY_LINE % (
+                ip_bytes, voltage, rssi,
+                _BOOL_TEXT[rbf_status], _BOOL_TEXT[squib_continuity], igniter_id,
+            )
+            for voltage, rssi, rbf_status, squib_continuity, igniter_id in frames
+        )
+        # Text already printed by the select loop must reach the terminal first.
+        sys.stdout.flush()
+        out.write(batch)
+        out.flush()
+
+def close_connection(state: PadState):
+    selector.unregister(state.conn)
+    state.conn.close()
+    tcp_connections.pop(state.ip_address, None)
 
-def telemetry_loop(ip_address: str, conn: socket.socket):
-    buffer = bytearray()
-    last_data_ts = time.time()
-    last_command_ts = 0.0
-    conn.settimeout(1.0)
+def handle_telemetry(state: PadState):
+    ip_address = state.ip_address
+    buffer = state.buffer
+    size = TELEMETRY_STRUCT.size
     try:
-        while True:
-            now = time.time()
-            if now - last_command_ts >= COMMAND_INTERVAL:
-                # Cycle through canned commands so the HMI can observe responses.
-                command_idx = int(now / COMMAND_INTERVAL) % len(COMMAND_PATTERN)
-                command_byte = COMMAND_PATTERN[command_idx]
-                try:
-                    conn.sendall(bytes([command_byte]))
-                except OSError as exc:
-                    print(f"Failed to send command to {ip_address} ({exc})")
-                    break
-                last_command_ts = now
+        count = state.conn.recv_into(state.view[state.write_pos:])
+    except BlockingIOError:
+        return
+    except OSError as exc:
+        print(f"Telemetry receive error from {ip_address} ({exc})")
+        close_connection(state)
+        return
+    if not count:
+        print(f"Telemetry connection to {ip_address} lost (peer closed)")
+        close_connection(state)
+        return
+    state.last_data_ts = time.monotonic()
+    write_pos = state.write_pos + count
+    # Decode every complete frame in one C-level pass; formatting and stdout happen off-loop.
+    complete = write_pos - write_pos % size
+    if complete:
+        _log_queue.put((ip_address, list(_iter_telemetry(state.view[:complete]))))
+    # Only a partial frame can remain; move it to the front for the next recv.
+    remaining = write_pos - complete
+    if remaining and complete:
+        buffer[:remaining] = buffer[complete:write_pos]
+    state.write_pos = remaining
+
+def service_connections():
+    """Send due commands and drop silent pads; runs once per select tick."""
+    now = time.monotonic()
+    for state in list(tcp_connections.values()):
+        if now - state.last_command_ts >= COMMAND_INTERVAL:
+            # Cycle through canned commands so the HMI can observe responses.
             try:
-                chunk = conn.recv(TELEMETRY_STRUCT.size - len(buffer))
-            except socket.timeout:
-                chunk = None
+                state.conn.sendall(_COMMAND_BYTES[state.command_idx])
             except OSError as exc:
-                print(f"Telemetry receive error from {ip_address} ({exc})")
-                break
-            if chunk is None:
-                pass
-            elif not chunk:
-                print(f"Telemetry connection to {ip_address} lost (peer closed)")
-                break
-            else:
-                buffer.extend(chunk)
-                last_data_ts = time.time()
-                while len(buffer) >= TELEMETRY_STRUCT.size:
-                    packet = bytes(buffer[:TELEMETRY_STRUCT.size])
-                    del buffer[:TELEMETRY_STRUCT.size]
-                    try:
-                        telemetry = parse_telemetry(packet)
-                        print(
-                            f"Telemetry from {ip_address}: "
-                            f"voltage={telemetry['voltage']:.2f}V, "
-                            f"rssi={telemetry['rssi']:.2f}, "
-                            f"rbf={telemetry['rbf_status']}, "
-                            f"continuity={telemetry['squib_continuity']}, "
-                            f"id={telemetry['igniter_id']}"
-                        )
-                    except ValueError as exc:
-                        print(f"Ignoring malformed telemetry from {ip_address} ({exc})")
-            if time.time() - last_data_ts >= 10.0:
-                print(f"Telemetry connection to {ip_address} lost (timeout)")
-                break
-    finally:
-        conn.close()
-        with connections_lock:
-            tcp_connections.pop(ip_address, None)
+                print(f"Failed to send command to {state.ip_address} ({exc})")
+                close_connection(state)
+                continue
+            state.last_command_ts = now
+            state.command_idx = (state.command_idx + 1) & _COMMAND_MASK
+        if now - state.last_data_ts >= 10.0:
+            print(f"Telemetry connection to {state.ip_address} lost (timeout)")
+            close_connection(state)
 
 def start_telemetry_connection(ip_address: str):
-    with connections_lock:
-        existing = tcp_connections.get(ip_address)
-        if isinstance(existing, threading.Thread) and existing.is_alive():
-            return
-        if existing is not None:
-            tcp_connections.pop(ip_address, None)
-        tcp_connections[ip_address] = None
+    if ip_address in tcp_connections:
+        return
     try:
         conn = socket.create_connection((ip_address, PORT), timeout=2.0)
     except OSError as exc:
         print(f"Failed to establish telemetry connection to {ip_address}:{PORT} ({exc})")
-        with connections_lock:
-            tcp_connections.pop(ip_address, None)
         return
-    thread = threading.Thread(target=telemetry_loop, args=(ip_address, conn), daemon=True)
-    thread.start()
-    with connections_lock:
-        tcp_connections[ip_address] = thread
+    # Send command bytes without Nagle delay; let telemetry bursts queue in the kernel.
+    conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TCP_RCVBUF_SIZE)
+    conn.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TCP_SNDBUF_SIZE)
+    # The selector is the only wakeup source; recv and send never wait.
+    conn.setblocking(False)
+    state = PadState(ip_address, conn)
+    selector.register(conn, selectors.EVENT_READ, state)
+    tcp_connections[ip_address] = state
     print(f"Established telemetry connection to {ip_address}:{PORT}")
 
+def handle_discovery(udp_sock: socket.socket):
+    """Drain up to DISCOVERY_BATCH queued discovery packets per wakeup."""
+    for _ in range(DISCOVERY_BATCH):
+        try:
+            count, addr = udp_sock.recvfrom_into(_discovery_buffer)
+        except BlockingIOError:
+            return
+        handle_discovery_packet(_discovery_view[:count], addr)
+
+def handle_discovery_packet(data, addr):
+    try:
+        device_id = parse_payload(data)
+        if device_id is None:
+            print(f"Ignoring packet from {addr[0]}: invalid auth key")
+            return
+        print(f"Received valid packet from {addr[0]} (ID {device_id})")
+        start_telemetry_connection(addr[0])
+    except ValueError as exc:
+        print(f"Ignoring malformed packet from {addr[0]} ({exc})")
+
 def main():
     udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
     udp_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
     udp_sock.bind(("", PORT))
+    udp_sock.setblocking(False)
+    # Discovery has no selector data; telemetry connections carry their PadState.
+    selector.register(udp_sock, selectors.EVENT_READ, None)
+    writer = threading.Thread(target=log_writer, daemon=True)
+    writer.start()
     print(f"Listening for UDP packets on port {PORT}")
     try:
         while True:
-            data, addr = udp_sock.recvfrom(BUFFER_SIZE)
-            try:
-                device_id, auth = parse_payload(data)
-                if auth != AUTH_KEY:
-                    print(f"Ignoring packet from {addr[0]}: invalid auth key")
-                    continue
-                print(f"Received valid packet from {addr[0]} (ID {device_id})")
-                start_telemetry_connection(addr[0])
-            except ValueError as exc:
-                print(f"Ignoring malformed packet from {addr[0]} ({exc})")
+            for key, _ in selector.select(timeout=SELECT_TIMEOUT):
+                if key.data is None:
+                    handle_discovery(udp_sock)
+                else:
+                    handle_telemetry(key.data)
+            service_connections()
     except KeyboardInterrupt:
         print("Stopping listener")
     finally:
+        for state in list(tcp_connections.values()):
+            close_connection(state)
+        selector.close()
         udp_sock.close()
+        _log_queue.put(None)
+        writer.join(timeout=1.0)
 
 if __name__ == "__main__":
     main()